@@ -1,13 +1,51 @@
+import sys
+
 import products
 
-MAX_ORDER_AMOUNT = 10000
+MENU = ("\n\n\t--- Store Menu ---\n"
+        "\t------------------\n"
+        "1. List all products in store\n"
+        "2. Show total amount in store\n"
+        "3. Make an order\n"
+        "4. Quit\n")
+PRODUCT_LIST_HEADER = "\nAll Products:\n------------"
+PRODUCT_LIST_FOOTER = "------------"
+CART_SEPARATOR = "----------------------------"
+# Translation table deleting ASCII digits; anything left over is not a number
+DIGIT_STRIP_TABLE = str.maketrans("", "", "0123456789")
+
+
+def read_input(prompt: str) -> str:
+    """
+    Reads a line of user input after displaying a prompt.
+
+    Interactive terminals use input() to keep line editing. Piped input is
+    read directly from stdin, which avoids the readline overhead per prompt.
+
+    Args:
+        prompt (str): The text displayed before reading.
+
+    Raises:
+        EOFError: If the input ended.
+
+    Returns:
+        str: The entered line without the trailing newline.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.rstrip("\n")
 
 
 def enter_to_continue():
     """
     Prompts the user to press 'Enter' to continue.
     """
-    input("\nPress 'Enter' to continue")
+    read_input("\nPress 'Enter' to continue")
 
 
 def get_valid_number_from_user(start_num: int, end_num: int) -> int:
@@ -22,28 +60,28 @@ def get_valid_number_from_user(start_num: int, end_num: int) -> int:
         int: The valid number chosen by the user or 0 if input is empty.
     """
     while True:
-        user_input = input(f"Please choose a number({start_num}-{end_num}): ")
+        user_input = read_input(f"Please choose a number({start_num}-{end_num}): ")
         if not user_input:
             return None
-        if not user_input.isdigit():
+        if user_input.translate(DIGIT_STRIP_TABLE):
             print("You haven't entered a number!")
             continue
-        if not start_num <= int(user_input) <= end_num:
+        try:
+            number = int(user_input)
+        except ValueError:
+            # Digit strings beyond the int conversion limit are far out of range anyway
+            number = None
+        if number is None or not start_num <= number <= end_num:
             print(f"Number must between '{start_num}' and '{end_num}'!")
             continue
-        return int(user_input)
+        return number
 
 
 def display_menu():
     """
     Displays the store menu with available options.
     """
-    print(f"\n\n\t--- Store Menu ---\n"
-          f"\t------------------\n"
-          f"1. List all products in store\n"
-          f"2. Show total amount in store\n"
-          f"3. Make an order\n"
-          f"4. Quit\n")
+    print(MENU)
 
 
 def display_products(store_obj):
@@ -57,11 +95,10 @@ def display_products(store_obj):
     if not products_list:
         print("\nStore is sold out.")
     else:
-        print(f"\nAll Products:\n"
-              f"------------")
-        for num, product in enumerate(products_list, 1):
-            print(f"{num}. {product}")
-        print(f"------------")
+        product_lines = "\n".join(f"{num}. {product}" for num, product in enumerate(products_list, 1))
+        print(f"{PRODUCT_LIST_HEADER}\n"
+              f"{product_lines}\n"
+              f"{PRODUCT_LIST_FOOTER}")
 
 
 def display_total_quantity(store_obj):
@@ -79,17 +116,18 @@ def display_current_cart(order_list):
     Displays the current contents of the user's cart.
 
     Args:
-        order_list (list): A list of tuples (Product, quantity).
+        order_list (dict): A mapping of Product to the quantity in the cart.
     """
     if not order_list:
         print("\nYour cart is currently empty.")
         return
 
-    print("\nCurrent Cart:")
-    print("----------------------------")
-    for i, (product, quantity) in enumerate(order_list, 1):
-        print(f"{i}. {product.name} - {quantity} pcs")
-    print("----------------------------")
+    cart_lines = "\n".join(f"{i}. {product.name} - {quantity} pcs"
+                           for i, (product, quantity) in enumerate(order_list.items(), 1))
+    print(f"\nCurrent Cart:\n"
+          f"{CART_SEPARATOR}\n"
+          f"{cart_lines}\n"
+          f"{CART_SEPARATOR}")
 
 
 def order_process(store_obj):
@@ -99,10 +137,9 @@ def order_process(store_obj):
     Args:
         store_obj: The store object containing all products.
     """
-    order_list = []
+    order_list = {}
     products_list = store_obj.get_all_products()
     display_products(store_obj)
-    current_quantities = [product.quantity for product in products_list]
 
     while True:
         print(f"\nWhen you want to finish order, enter empty text.\n"
@@ -110,68 +147,28 @@ def order_process(store_obj):
         user_input = get_valid_number_from_user(1, len(products_list))
         if not user_input:
             if order_list:
-                total_order = store_obj.order(order_list)
+                total_order = store_obj.order(list(order_list.items()))
                 display_current_cart(order_list)
                 print(f"\n*** Order made. Total payment: {total_order}{products.CURRENCY} ***")
                 break
             print("\nOrder was empty.")
             break
 
-        current_product_idx = user_input - 1
-        current_product = products_list[current_product_idx]
+        current_product = products_list[user_input - 1]
 
-        if current_quantities[current_product_idx] < 1 and not isinstance(current_product, products.NonStockedProduct):
-            print("\nYou have all items in your cart.\n"
-                  "Checkout or add another product.\n")
+        existing_quantity = order_list.get(current_product, 0)
+        max_quantity = current_product.max_orderable(existing_quantity)
+        if max_quantity < 1:
+            print(f"\nYou can't add more of '{current_product.name}' to your cart.\n"
+                  f"Checkout or add another product.\n")
             display_current_cart(order_list)
             continue
 
         print(f"What amount do you want?")
-        if isinstance(current_product, products.NonStockedProduct):
-            new_quantity = get_valid_number_from_user(1, MAX_ORDER_AMOUNT)
-        elif isinstance(current_product, products.LimitedProduct):
-            new_quantity = get_valid_number_from_user(1, current_product.maximum)
-        else:
-            new_quantity = get_valid_number_from_user(1, current_quantities[current_product_idx])
-
+        new_quantity = get_valid_number_from_user(1, max_quantity)
         if not new_quantity:
             continue
 
-        existing_index = None
-        for i, (product, _) in enumerate(order_list):
-            if product == current_product:
-                existing_index = i
-                break
-
-        added_to_cart_message = f"\n'{current_product.name}' successfully added to cart. ({new_quantity} pcs)\n"
-
-        if existing_index is not None:
-            _, existing_quantity = order_list[existing_index]
-            if isinstance(current_product, products.NonStockedProduct):
-                order_list[existing_index] = (current_product, existing_quantity + new_quantity)
-                print(added_to_cart_message)
-                display_current_cart(order_list)
-
-            elif isinstance(current_product, products.LimitedProduct):
-                if existing_quantity + new_quantity > current_product.maximum:
-                    print(f"\nYou can only have {current_product.maximum} of '{current_product.name}' in your cart!")
-                    display_current_cart(order_list)
-                    continue
-                else:
-                    order_list[existing_index] = (current_product, existing_quantity + new_quantity)
-                    current_quantities[current_product_idx] -= new_quantity
-                    print(added_to_cart_message)
-                    display_current_cart(order_list)
-
-            else:
-                order_list[existing_index] = (current_product, existing_quantity + new_quantity)
-                current_quantities[current_product_idx] -= new_quantity
-                print(added_to_cart_message)
-                display_current_cart(order_list)
-
-        else:
-            order_list.append((current_product, new_quantity))
-            if not isinstance(current_product, products.NonStockedProduct):
-                current_quantities[current_product_idx] -= new_quantity
-            print(added_to_cart_message)
-            display_current_cart(order_list)
+        order_list[current_product] = existing_quantity + new_quantity
+        print(f"\n'{current_product.name}' successfully added to cart. ({new_quantity} pcs)\n")
+        display_current_cart(order_list)
@@ -4,6 +4,12 @@ import store
 from console import enter_to_continue, get_valid_number_from_user, display_products, display_menu, \
     display_total_quantity, order_process
 
+# Menu option handlers, each called with the store; option 4 quits
+MENU_ACTIONS = {1: display_products,
+                2: display_total_quantity,
+                3: order_process}
+QUIT_OPTION = 4
+
 
 def main():
     """
@@ -34,20 +40,14 @@ def main():
     best_buy = store.Store(product_list)
     while True:
         display_menu()
-        user_input = get_valid_number_from_user(1, 4)
-
-        match user_input:
-            case 1:
-                display_products(best_buy)
-                enter_to_continue()
-            case 2:
-                display_total_quantity(best_buy)
-                enter_to_continue()
-            case 3:
-                order_process(best_buy)
-                enter_to_continue()
-            case 4:
-                break
+        user_input = get_valid_number_from_user(1, QUIT_OPTION)
+        if user_input == QUIT_OPTION:
+            break
+
+        action = MENU_ACTIONS.get(user_input)
+        if action is not None:
+            action(best_buy)
+            enter_to_continue()
 
 
 if __name__ == "__main__":
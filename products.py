@@ -1,6 +1,17 @@
+import functools
+import math
+import sys
+
 import promotions
 
 CURRENCY = "€"
+MAX_ORDER_AMOUNT = 10000
+# Counters bumped on every stock change and rename of any product, so stores can
+# tell when their cached views are out of date without being notified. They are
+# module globals, since writing a class attribute would invalidate the attribute
+# caches of every Product instance.
+_stock_changes = 0
+_name_changes = 0
 
 
 class Product:
@@ -15,6 +26,9 @@ class Product:
         promotion (promotions.Promotion or None): The promotion applied to the product.
     """
 
+    __slots__ = ('_str_cache', '_price_fn', '_name', '_price', '_price_cents',
+                 '_quantity', '_active', '_promotion', '_promotion_version')
+
     def __init__(self, name: str, price: float, quantity: int):
         """Initialize a Product instance with validation via property setters.
 
@@ -27,12 +41,43 @@ class Product:
             TypeError: If the provided values are of incorrect types.
             ValueError: If the provided values do not meet validation criteria.
         """
+        self._str_cache = None
+        self._price_fn = None
+        self._promotion_version = 0
         self.name = name
         self.price = price
         self.quantity = quantity
         self.active = True
         self.promotion = None
 
+    @classmethod
+    def _from_trusted(cls, name: str, price: float, quantity: int):
+        """Create a product from values that are already known to be valid.
+
+        Skips the validation of the property setters, for bulk loading catalogs
+        whose types and ranges were checked once for all rows by the caller.
+        The result is the same as calling the constructor with valid values.
+
+        Args:
+            name (str): The non-empty name of the product.
+            price (float): The finite, non-negative price of the product.
+            quantity (int): The non-negative initial quantity of the product.
+
+        Returns:
+            Product: The new product instance.
+        """
+        product = cls.__new__(cls)
+        product._str_cache = None
+        product._price_fn = None
+        product._promotion_version = 0
+        product._name = sys.intern(name)
+        product._price_cents = round(price * 100)
+        product._price = product._price_cents / 100
+        product._quantity = quantity
+        product._active = True
+        product._promotion = None
+        return product
+
     @property
     def name(self):
         """Get the name of the product.
@@ -53,11 +98,15 @@ class Product:
             TypeError: If the provided value is not a string.
             ValueError: If the provided value is empty or only whitespace.
         """
+        global _name_changes
         if not isinstance(value, str):
             raise TypeError("Product name must be a string.")
         if not value.strip():
             raise ValueError("Product name cannot be empty or just spaces.")
-        self._name = value
+        # Interned, so equal names are the same object and __eq__ can compare identity
+        self._name = sys.intern(str(value))
+        self._str_cache = None
+        _name_changes += 1
 
     @property
     def price(self):
@@ -75,15 +124,24 @@ class Product:
         Args:
             value (int or float): The new price for the product.
 
+        The price is rounded to whole cents, so the displayed price, regular
+        purchases and promotions all use the same value.
+
         Raises:
             TypeError: If the provided value is not an int or float.
-            ValueError: If the provided value is negative.
+            ValueError: If the provided value is not finite or negative.
         """
         if not isinstance(value, (int, float)):
             raise TypeError("Price must be a number (int or float).")
+        if not math.isfinite(value):
+            raise ValueError("Price must be a finite number.")
         if value < 0:
             raise ValueError("Price cannot be negative.")
-        self._price = float(value)
+        # Whole cents for exact integer arithmetic in regular-price purchases
+        self._price_cents = round(value * 100)
+        self._price = self._price_cents / 100
+        self._str_cache = None
+        self._price_fn = None
 
     @property
     def active(self):
@@ -104,9 +162,11 @@ class Product:
         Raises:
             TypeError: If the provided value is not a boolean.
         """
+        global _stock_changes
         if not isinstance(value, bool):
             raise TypeError("Active must be a boolean.")
         self._active = value
+        _stock_changes += 1
 
     @property
     def promotion(self):
@@ -126,6 +186,9 @@ class Product:
         if value is not None and not isinstance(value, promotions.Promotion):
             raise TypeError("Promotion must be an instance of promotions.Promotion or None.")
         self._promotion = value
+        self._promotion_version = value._version if value is not None else 0
+        self._str_cache = None
+        self._price_fn = None
 
     @property
     def quantity(self):
@@ -143,14 +206,34 @@ class Product:
             TypeError: If value is not an integer.
             ValueError: If value is negative.
         """
+        global _stock_changes
         if not isinstance(value, int):
             raise TypeError("Quantity must be an integer.")
         if value < 0:
             raise ValueError("Quantity cannot be negative.")
         self._quantity = value
+        self._str_cache = None
+        _stock_changes += 1
         if self._quantity == 0:
             self.deactivate()
 
+    def _set_quantity_unchecked(self, value):
+        """Sets a quantity that is already known to be a non-negative integer.
+
+        Used internally by buy() and Store.add_product() to skip the validation
+        of the quantity setter.
+        If quantity is set to 0, the product is deactivated.
+
+        Args:
+            value (int): The new quantity to set.
+        """
+        global _stock_changes
+        self._quantity = value
+        self._str_cache = None
+        _stock_changes += 1
+        if value == 0:
+            self.deactivate()
+
     def is_active(self) -> bool:
         """
         Checks if the product is active.
@@ -158,7 +241,7 @@ class Product:
         Returns:
             bool: True if the product is active, False otherwise.
         """
-        return self.active
+        return self._active
 
     def activate(self):
         """
@@ -172,6 +255,156 @@ class Product:
         """
         self.active = False
 
+    def is_stock_tracked(self) -> bool:
+        """
+        Indicates whether buying the product reduces its stock.
+
+        Returns:
+            bool: True, since regular products are sold from stock.
+        """
+        return True
+
+    def max_orderable(self, in_cart: int = 0) -> int:
+        """
+        Calculates how many more units can be put into a cart.
+
+        Args:
+            in_cart (int): The number of units already in the cart.
+
+        Returns:
+            int: The number of units that can still be ordered.
+        """
+        return self.quantity - in_cart
+
+    @staticmethod
+    def _check_purchase_quantity(quantity):
+        """
+        Validates the quantity of a purchase.
+
+        Args:
+            quantity (int): The number of units to buy.
+
+        Raises:
+            TypeError: If quantity is not an integer.
+            ValueError: If quantity is negative or 0.
+        """
+        if type(quantity) is not int:
+            raise TypeError("Quantity must be an integer.")
+        if quantity <= 0:
+            raise ValueError("Quantity cannot be negative or 0.")
+
+    def _check_purchase(self, quantity):
+        """
+        Validates that a quantity of the product can be bought.
+
+        Args:
+            quantity (int): The number of units to buy.
+
+        Raises:
+            TypeError: If quantity is not an integer.
+            ValueError: If quantity is negative or exceeds available stock.
+        """
+        # Same checks as _check_purchase_quantity(), inlined for the common purchase path
+        if type(quantity) is not int:
+            raise TypeError("Quantity must be an integer.")
+        if quantity <= 0:
+            raise ValueError("Quantity cannot be negative or 0.")
+        if quantity > self._quantity:
+            raise ValueError("Not enough products in stock.")
+
+    def _price_for(self, quantity) -> float:
+        """
+        Calculates the price of a quantity of the product, applying its promotion.
+
+        The pricing function is built once per price and promotion and reused
+        for later purchases.
+
+        Args:
+            quantity (int): The number of units bought.
+
+        Returns:
+            float: The unrounded total price.
+        """
+        promotion = self._promotion
+        if promotion is not None and promotion._version != self._promotion_version:
+            self._promotion_changed()
+        price_fn = self._price_fn
+        if price_fn is None:
+            price_fn = self._build_price_fn()
+        return price_fn(quantity)
+
+    def _promotion_changed(self):
+        """
+        Drops the cached pricing function and string after the promotion itself changed.
+        """
+        self._promotion_version = self._promotion._version
+        self._price_fn = None
+        self._str_cache = None
+
+    def _build_price_fn(self):
+        """
+        Builds and caches the pricing function for the current price and promotion.
+
+        Returns:
+            Callable[[int], float]: A function mapping a quantity to the total price.
+        """
+        promotion = self._promotion
+        if promotion is not None:
+            price_fn = promotion.build(self._price)
+            if price_fn is None:
+                # Promotions without a pricing function are applied per purchase
+                price_fn = functools.partial(promotion.apply_promotion, self)
+        else:
+            price_fn = self._build_regular_price(self._price_cents)
+        self._price_fn = price_fn
+        return price_fn
+
+    @staticmethod
+    def _build_regular_price(price_cents):
+        """
+        Creates the pricing function used when no promotion is applied.
+
+        The total is calculated in integer cents and converted once, which avoids
+        float errors such as 3 * 0.1 == 0.30000000000000004.
+
+        Args:
+            price_cents (int): The unit price of the product in cents.
+
+        Returns:
+            Callable[[int], float]: A function mapping a quantity to the total price.
+        """
+        def price_for(quantity):
+            return quantity * price_cents / 100
+
+        return price_for
+
+    def _take_stock(self, quantity):
+        """
+        Removes a bought quantity from the stock.
+
+        Args:
+            quantity (int): The number of units bought, already validated by _check_purchase().
+        """
+        self._set_quantity_unchecked(self._quantity - quantity)
+
+    def _commit_purchase(self, quantity) -> float:
+        """
+        Prices a validated purchase and removes it from the stock.
+
+        buy() and the multi-line path of Store.order() both end here, so
+        subclasses customize a purchase by overriding this method or the hooks
+        it calls, instead of buy().
+
+        Args:
+            quantity (int): The number of units bought, already validated by _check_purchase().
+
+        Returns:
+            float: The total price of the purchased products, rounded to two decimal places.
+        """
+        total_price = self._price_for(quantity)
+        self._take_stock(quantity)
+        return round(total_price, 2)
+
     def buy(self, quantity) -> float:
         """
         Processes the purchase of a specified quantity of the product.
@@ -186,30 +419,42 @@ class Product:
         Returns:
             float: The total price of the purchased products, rounded to two decimal places.
         """
-        # Quantity validation
-        if not isinstance(quantity, int):
-            raise TypeError("Quantity must be an integer.")
-        if quantity <= 0:
-            raise ValueError("Quantity cannot be negative or 0.")
-
-        if self.quantity >= quantity:
-            updated_quantity = self.quantity - quantity
-            self.quantity = updated_quantity
-            if self.promotion is not None:
-                total_price = self.promotion.apply_promotion(self, quantity)
-            else:
-                total_price = float(quantity * self.price)
-            return round(total_price, 2)
-        raise ValueError("Not enough products in stock.")
+        self._check_purchase(quantity)
+        return self._commit_purchase(quantity)
 
     def __str__(self):
         """
         Displays product details in a formatted string.
 
+        The string is built once and reused until the product changes.
+
         Returns:
             str: A formatted string showing product name, price, quantity and Promotion.
         """
-        promotion_str = f" | Promotion: {self.promotion.name}" if self.promotion is not None else ""
+        promotion = self._promotion
+        if promotion is not None and promotion._version != self._promotion_version:
+            self._promotion_changed()
+        if self._str_cache is None:
+            self._str_cache = self._format()
+        return self._str_cache
+
+    def _promotion_suffix(self):
+        """
+        Builds the promotion part shared by the formatted strings of all product types.
+
+        Returns:
+            str: The promotion suffix, or an empty string if there is no promotion.
+        """
+        return f" | Promotion: {self.promotion.name}" if self.promotion is not None else ""
+
+    def _format(self):
+        """
+        Builds the formatted string returned by __str__.
+
+        Returns:
+            str: A formatted string showing product name, price, quantity and Promotion.
+        """
+        promotion_str = self._promotion_suffix()
         return (f"{self.name} | Price: {self.price}{CURRENCY} | "
                 f"Quantity: {self.quantity}{promotion_str}")
 
@@ -249,7 +494,16 @@ class Product:
         """
         if not isinstance(other, Product):
             return False
-        return self.name == other.name
+        return self._name is other._name
+
+    def __hash__(self):
+        """
+        Hash the product by its name, consistent with __eq__.
+
+        Returns:
+            int: The hash of the product name.
+        """
+        return hash(self.name)
 
 
 class NonStockedProduct(Product):
@@ -260,6 +514,8 @@ class NonStockedProduct(Product):
     Inherits from Product, but always fixes quantity to 0.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, price: float):
         """
         Initialize a NonStockedProduct.
@@ -270,14 +526,28 @@ class NonStockedProduct(Product):
         """
         super().__init__(name, price, 0)
 
-    def __str__(self):
+    @classmethod
+    def _from_trusted(cls, name: str, price: float):
+        """
+        Create a non-stocked product from values that are already known to be valid.
+
+        Args:
+            name (str): The non-empty name of the product.
+            price (float): The non-negative price of the product.
+
+        Returns:
+            NonStockedProduct: The new product instance.
+        """
+        return super()._from_trusted(name, price, 0)
+
+    def _format(self):
         """
         Return a string representation of the product.
 
         Returns:
             str: A formatted string showing product name, price and Promotion.
         """
-        promotion_str = f" | Promotion: {self.promotion.name}" if self.promotion is not None else ""
+        promotion_str = self._promotion_suffix()
         return (f"{self.name} | Price: {self.price}{CURRENCY} | "
                 f"Quantity: Unlimited"
                 f"{promotion_str}")
@@ -292,9 +562,30 @@ class NonStockedProduct(Product):
         """
         return True
 
-    def buy(self, quantity: int) -> float:
+    def is_stock_tracked(self) -> bool:
+        """
+        Indicates that buying a NonStockedProduct does not reduce any stock.
+
+        Returns:
+            bool: Always returns False.
+        """
+        return False
+
+    def max_orderable(self, in_cart: int = 0) -> int:
+        """
+        Returns the fixed maximum amount per order, since there is no stock limit.
+
+        Args:
+            in_cart (int): The number of units already in the cart.
+
+        Returns:
+            int: MAX_ORDER_AMOUNT, independent of the cart contents.
+        """
+        return MAX_ORDER_AMOUNT
+
+    def _check_purchase(self, quantity):
         """
-        Process the purchase of a specified quantity of the product.
+        Validates the quantity of a purchase; there is no stock to check.
 
         Args:
             quantity (int): The number of units to buy.
@@ -302,22 +593,46 @@ class NonStockedProduct(Product):
         Raises:
             TypeError: If quantity is not an integer.
             ValueError: If quantity is negative or zero.
+        """
+        self._check_purchase_quantity(quantity)
 
-        Returns:
-            float: The total price of the purchased products, rounded to two
-                   decimal places.
+    def _take_stock(self, quantity):
         """
-        if not isinstance(quantity, int):
-            raise TypeError("Quantity must be an integer.")
-        if quantity <= 0:
-            raise ValueError("Quantity cannot be negative or 0.")
+        Does nothing, since non-stocked products have no stock to reduce.
 
-        if self.promotion is not None:
-            total_price = self.promotion.apply_promotion(self, quantity)
-        else:
-            total_price = quantity * self.price
+        Args:
+            quantity (int): The number of units bought.
+        """
+
+    def buy_batch(self, quantities) -> list[float]:
+        """
+        Process several purchases of the product at once.
 
-        return round(float(total_price), 2)
+        Since there is no stock to update, all purchases are validated first
+        and then priced with the same pricing function.
+
+        Args:
+            quantities (Iterable[int]): The number of units of each purchase.
+
+        Raises:
+            TypeError: If a quantity is not an integer.
+            ValueError: If a quantity is negative or zero.
+
+        Returns:
+            list[float]: The total price of each purchase, rounded to two
+                         decimal places.
+        """
+        quantities = list(quantities)
+        for quantity in quantities:
+            self._check_purchase_quantity(quantity)
+
+        promotion = self._promotion
+        if promotion is not None and promotion._version != self._promotion_version:
+            self._promotion_changed()
+        price_fn = self._price_fn
+        if price_fn is None:
+            price_fn = self._build_price_fn()
+        return [round(price_fn(quantity), 2) for quantity in quantities]
 
 
 class LimitedProduct(Product):
@@ -326,8 +641,13 @@ class LimitedProduct(Product):
 
     This class extends the Product class by adding a maximum purchase limit
     per transaction.
+
+    Attributes:
+        maximum (int): The maximum number of items that can be purchased in one transaction.
     """
 
+    __slots__ = ('_maximum',)
+
     def __init__(self, name: str, price: float, quantity: int, maximum: int):
         """
         Initialize a new LimitedProduct instance.
@@ -345,11 +665,32 @@ class LimitedProduct(Product):
         super().__init__(name, price, quantity)
         self.maximum = maximum
 
+    @classmethod
+    def _from_trusted(cls, name: str, price: float, quantity: int, maximum: int):
+        """
+        Create a limited product from values that are already known to be valid.
+
+        Parameters:
+            name (str): The non-empty name of the product.
+            price (float): The finite, non-negative price of the product.
+            quantity (int): The non-negative available quantity in stock.
+            maximum (int): The positive maximum number of items per transaction.
+
+        Returns:
+            LimitedProduct: The new product instance.
+        """
+        product = super()._from_trusted(name, price, quantity)
+        product._maximum = maximum
+        return product
+
     @property
     def maximum(self) -> int:
         """
         Get the maximum allowed quantity per purchase.
 
+        Purchase checks read the _maximum slot directly, so only outside
+        callers go through this property.
+
         Returns:
             int: The maximum number of items that can be purchased.
         """
@@ -372,8 +713,9 @@ class LimitedProduct(Product):
         if value <= 0:
             raise ValueError("Maximum must be positive.")
         self._maximum = value
+        self._str_cache = None
 
-    def __str__(self):
+    def _format(self):
         """
         Return a string representation of the product.
 
@@ -383,52 +725,50 @@ class LimitedProduct(Product):
         Returns:
             str: A formatted string with the product details.
         """
-        promotion_str = f" | Promotion: {self.promotion.name}" if self.promotion is not None else ""
+        promotion_str = self._promotion_suffix()
         return (f"{self.name} | "
                 f"Price: {self.price}{CURRENCY} | "
                 f"Quantity: {self.quantity} | "
                 f"Maximum: {self.maximum}"
                 f"{promotion_str}")
 
-    def buy(self, quantity: int) -> float:
+    def max_orderable(self, in_cart: int = 0) -> int:
+        """
+        Calculates how many more units can be put into a cart.
+
+        The amount is limited by the available stock and by the maximum
+        allowed per transaction.
+
+        Args:
+            in_cart (int): The number of units already in the cart.
+
+        Returns:
+            int: The number of units that can still be ordered.
+        """
+        return min(self.quantity, self._maximum) - in_cart
+
+    def _check_purchase(self, quantity):
         """
-        Attempt to purchase a specified quantity of the product.
+        Validates that a quantity of the product can be bought.
 
         Validates that the quantity is an integer, positive, does not exceed the
         maximum allowed per transaction, and that there is enough stock available.
-        If valid, updates the stock and returns the total price for the purchase.
 
         Parameters:
             quantity (int): The number of items to purchase.
 
-        Returns:
-            float: The total price for the purchased items, rounded to 2 decimal places.
-
         Raises:
             TypeError: If quantity is not an integer.
             ValueError: If quantity is less than or equal to 0.
             ValueError: If quantity exceeds the maximum allowed per transaction.
             ValueError: If there is insufficient stock available.
         """
-        # Quantity validation
-        if not isinstance(quantity, int):
-            raise TypeError("Quantity must be an integer.")
-        if quantity <= 0:
-            raise ValueError("Quantity cannot be negative or 0.")
+        self._check_purchase_quantity(quantity)
 
         # Maximum validation
-        if quantity > self.maximum:
+        if quantity > self._maximum:
             raise ValueError(f"You cannot buy more than "
-                             f"'{self.maximum}' pcs from '{self.name}'.")
-
-        if self.quantity >= quantity:
-            updated_quantity = self.quantity - quantity
-            self.quantity = updated_quantity
-            if self.promotion is not None:
-                total_price = self.promotion.apply_promotion(self, quantity)
-            else:
-                total_price = quantity * self.price
-
-            return round(float(total_price), 2)
+                             f"'{self._maximum}' pcs from '{self.name}'.")
 
-        raise ValueError("Not enough products in stock.")
+        if quantity > self._quantity:
+            raise ValueError("Not enough products in stock.")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
 import products
 
@@ -13,16 +14,49 @@ class Promotion(ABC):
     Methods:
         apply_promotion(product, quantity) -> float:
             Abstract method to apply the promotion to a product purchase.
+        build(price) -> Callable[[int], float] or None:
+            Create a pricing function for a fixed unit price, if the promotion has one.
+        apply_batch(prices, quantities) -> list[float]:
+            Calculate the promotion totals for many purchases at once.
     """
 
+    __slots__ = ('_name', '_version')
+
     def __init__(self, name):
+        # Bumped on every change, so products know when their caches are out of date
+        self._version = 0
+        self.name = name
+
+    @property
+    def name(self):
+        """
+        Get the name of the promotion.
+
+        Returns:
+            str: The name of the promotion.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Set the name of the promotion ensuring it is a non-empty string.
+
+        Args:
+            value (str): The new name for the promotion.
+
+        Raises:
+            TypeError: If the provided value is not a string.
+            ValueError: If the provided value is empty or only whitespace.
+        """
         # Name validation
-        if not isinstance(name, str):
+        if not isinstance(value, str):
             raise TypeError("Promotion name must be a string.")
-        if not name.strip():
+        if not value.strip():
             raise ValueError("Promotion name cannot be empty or just spaces.")
 
-        self.name = name
+        self._name = value
+        self._version += 1
 
     @abstractmethod
     def apply_promotion(self, product, quantity) -> float:
@@ -38,6 +72,48 @@ class Promotion(ABC):
         """
         pass
 
+    def build(self, price) -> Callable[[int], float] | None:
+        """
+        Create a function that calculates the promotion total for a fixed unit price.
+
+        Products build this once when the promotion is assigned, so each purchase
+        only evaluates the closed-form price calculation. The default returns None,
+        and products then price every purchase with apply_promotion().
+
+        Parameters:
+            price (float): The unit price of the product.
+
+        Returns:
+            Callable[[int], float] or None: A function mapping a quantity to the total price,
+                                            or None if the promotion has no such function.
+        """
+        return None
+
+    def apply_batch(self, prices, quantities) -> list[float]:
+        """
+        Calculate the promotion totals for many purchases at once.
+
+        Subclasses override this with their formula applied over the whole
+        sequence, which avoids building a pricing function per line.
+
+        Parameters:
+            prices (Iterable[float]): The unit prices of the purchased products.
+            quantities (Iterable[int]): The purchased quantities, in the same order as prices.
+
+        Raises:
+            NotImplementedError: If the promotion does not implement build().
+
+        Returns:
+            list[float]: The total price of each purchase after applying the promotion.
+        """
+        totals = []
+        for price, quantity in zip(prices, quantities):
+            price_fn = self.build(price)
+            if price_fn is None:
+                raise NotImplementedError(f"{type(self).__name__} does not support batch pricing.")
+            totals.append(price_fn(quantity))
+        return totals
+
 
 class PercentDiscount(Promotion):
     """
@@ -47,6 +123,8 @@ class PercentDiscount(Promotion):
         percent (float): The discount percentage (greater than 0 and less than 100).
     """
 
+    __slots__ = ('_percent', '_discount_factor')
+
     def __init__(self, name, percent):
         """
         Initialize a PercentDiscount promotion.
@@ -60,13 +138,40 @@ class PercentDiscount(Promotion):
             ValueError: If the name is empty or percent is not between 0 and 100.
         """
         super().__init__(name)
+        self.percent = percent
+
+    @property
+    def percent(self):
+        """
+        Get the discount percentage.
+
+        Returns:
+            int or float: The discount percentage.
+        """
+        return self._percent
+
+    @percent.setter
+    def percent(self, value):
+        """
+        Set the discount percentage ensuring it is between 0 and 100.
+
+        Parameters:
+            value (int or float): The new discount percentage.
+
+        Raises:
+            TypeError: If value is not a number.
+            ValueError: If value is not between 0 and 100.
+        """
         # percent validation
-        if not isinstance(percent, (int, float)):
+        if not isinstance(value, (int, float)):
             raise TypeError("Percent must be an integer or float")
-        if not 0 < percent < 100:
+        if not 0 < value < 100:
             raise ValueError("Percent must be greater than 0 and less than 100.")
 
-        self.percent = percent
+        self._percent = value
+        # Share of the price that is discounted, precomputed for the pricing functions
+        self._discount_factor = value / 100
+        self._version += 1
 
     def apply_promotion(self, product, quantity) -> float:
         """
@@ -88,14 +193,46 @@ class PercentDiscount(Promotion):
             raise TypeError(f"{product} is not from the Product class.")
 
         # Quantity validation
-        if not isinstance(quantity, int):
+        if type(quantity) is not int:
             raise TypeError("Quantity must be an integer.")
         if quantity < 0:
             raise ValueError("Quantity cannot be negative.")
 
         total = product.price * quantity
-        discount = total * (self.percent / 100)
-        return total - discount
+        return total - total * self._discount_factor
+
+    def build(self, price) -> Callable[[int], float]:
+        """
+        Create a function that calculates the discounted total for a fixed unit price.
+
+        Parameters:
+            price (float): The unit price of the product.
+
+        Returns:
+            Callable[[int], float]: A function mapping a quantity to the discounted total.
+        """
+        discount_factor = self._discount_factor
+
+        def price_for(quantity):
+            total = price * quantity
+            return total - total * discount_factor
+
+        return price_for
+
+    def apply_batch(self, prices, quantities) -> list[float]:
+        """
+        Calculate the discounted totals for many purchases at once.
+
+        Parameters:
+            prices (Iterable[float]): The unit prices of the purchased products.
+            quantities (Iterable[int]): The purchased quantities, in the same order as prices.
+
+        Returns:
+            list[float]: The discounted total of each purchase.
+        """
+        discount_factor = self._discount_factor
+        return [(total := price * quantity) - total * discount_factor
+                for price, quantity in zip(prices, quantities)]
 
 
 class SecondHalfPrice(Promotion):
@@ -106,6 +243,8 @@ class SecondHalfPrice(Promotion):
     the second item is sold at half its normal price.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Initialize a SecondHalfPrice promotion.
@@ -139,14 +278,48 @@ class SecondHalfPrice(Promotion):
             raise TypeError(f"{product} is not from the Product class.")
 
         # Quantity validation
-        if not isinstance(quantity, int):
+        if type(quantity) is not int:
             raise TypeError("Quantity must be an integer.")
         if quantity < 0:
             raise ValueError("Quantity cannot be negative.")
 
-        full_price_items = quantity // 2 + quantity % 2
-        half_price_items = quantity // 2
-        return (full_price_items * product.price) + (half_price_items * product.price * 0.5)
+        price = product.price
+        half_price_items = quantity >> 1
+        full_price_items = quantity - half_price_items
+        return (full_price_items * price) + (half_price_items * (price * 0.5))
+
+    def build(self, price) -> Callable[[int], float]:
+        """
+        Create a function that calculates the total with every second product at half price.
+
+        Parameters:
+            price (float): The unit price of the product.
+
+        Returns:
+            Callable[[int], float]: A function mapping a quantity to the total price.
+        """
+        half_price = price * 0.5
+
+        def price_for(quantity):
+            half_price_items = quantity >> 1
+            full_price_items = quantity - half_price_items
+            return (full_price_items * price) + (half_price_items * half_price)
+
+        return price_for
+
+    def apply_batch(self, prices, quantities) -> list[float]:
+        """
+        Calculate the totals with every second product at half price for many purchases at once.
+
+        Parameters:
+            prices (Iterable[float]): The unit prices of the purchased products.
+            quantities (Iterable[int]): The purchased quantities, in the same order as prices.
+
+        Returns:
+            list[float]: The total price of each purchase.
+        """
+        return [((quantity - (quantity >> 1)) * price) + ((quantity >> 1) * (price * 0.5))
+                for price, quantity in zip(prices, quantities)]
 
 
 class ThirdOneFree(Promotion):
@@ -156,6 +329,8 @@ class ThirdOneFree(Promotion):
     For every three products purchased, the customer pays for two.
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Initialize a ThirdOneFree promotion.
@@ -191,12 +366,45 @@ class ThirdOneFree(Promotion):
             raise TypeError(f"{product} is not from the Product class.")
 
         # Quantity validation
-        if not isinstance(quantity, int):
+        if type(quantity) is not int:
             raise TypeError("Quantity must be an integer.")
         if quantity < 0:
             raise ValueError("Quantity cannot be negative.")
 
-        sets_of_three = quantity // 3
-        remaining = quantity % 3
+        sets_of_three, remaining = divmod(quantity, 3)
         payable_quantity = (sets_of_three * 2) + remaining
         return payable_quantity * product.price
+
+    def build(self, price) -> Callable[[int], float]:
+        """
+        Create a function that calculates the "buy 2, get 1 free" total for a fixed unit price.
+
+        Parameters:
+            price (float): The unit price of the product.
+
+        Returns:
+            Callable[[int], float]: A function mapping a quantity to the total price.
+        """
+        def price_for(quantity):
+            sets_of_three, remaining = divmod(quantity, 3)
+            payable_quantity = (sets_of_three * 2) + remaining
+            return payable_quantity * price
+
+        return price_for
+
+    def apply_batch(self, prices, quantities) -> list[float]:
+        """
+        Calculate the "buy 2, get 1 free" totals for many purchases at once.
+
+        Parameters:
+            prices (Iterable[float]): The unit prices of the purchased products.
+            quantities (Iterable[int]): The purchased quantities, in the same order as prices.
+
+        Returns:
+            list[float]: The total price of each purchase.
+        """
+        totals = []
+        for price, quantity in zip(prices, quantities):
+            sets_of_three, remaining = divmod(quantity, 3)
+            totals.append(((sets_of_three * 2) + remaining) * price)
+        return totals
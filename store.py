@@ -1,3 +1,5 @@
+import itertools
+
 import products
 
 
@@ -6,13 +8,15 @@ class Store:
     Represents a store containing a list of products.
 
     Attributes:
-        products (list[products.Product]): A list of products available in the store.
+        products (tuple[products.Product, ...]): The products available in the store.
     """
 
     def __init__(self, products_list: list[products.Product]):
         """
         Initializes the Store with a list of products.
 
+        The list is copied, so later changes to it do not affect the store.
+
         Args:
             products_list (list[products.Product]): A list of Product instances.
 
@@ -26,19 +30,73 @@ class Store:
         if not all(isinstance(product, products.Product) for product in products_list):
             raise TypeError("All elements in products_list must be instances of the Product class.")
 
-        self.products = products_list
+        self._products = products_list.copy()
+        # Views rebuilt on read, once products changed since they were built
+        self._stock_seen = -1
+        self._total_quantity = 0
+        self._active_products = ()
+        self._names_seen = -1
+        self._by_name = {}
+
+    def _refresh_stock_views(self):
+        """
+        Rebuilds the total quantity and the active products if any product's stock changed.
+
+        Products only bump a counter when their quantity or active status changes,
+        so writes stay cheap and the views are rebuilt once, when they are read.
+        """
+        stock_changes = products._stock_changes
+        if self._stock_seen != stock_changes:
+            self._total_quantity = sum(product.quantity for product in self._products)
+            self._active_products = tuple(product for product in self._products
+                                          if product.is_active())
+            self._stock_seen = stock_changes
+
+    def _name_index(self):
+        """
+        Returns the index of the store's products by name, rebuilt if any product was renamed.
+
+        The first product with a name wins, matching list.index() lookups.
+
+        Returns:
+            dict[str, products.Product]: The products keyed by name.
+        """
+        name_changes = products._name_changes
+        if self._names_seen != name_changes:
+            by_name = {}
+            for product in self._products:
+                by_name.setdefault(product.name, product)
+            self._by_name = by_name
+            self._names_seen = name_changes
+        return self._by_name
 
     def __contains__(self, item):
-        return item in self.products
+        return isinstance(item, products.Product) and item.name in self._name_index()
 
     def __add__(self, other):
+        """
+        Combines two stores into a new store.
+
+        Products of the other store that already exist in this store are merged
+        into the existing product by quantity, using the name index, so combining
+        stores takes linear time.
+
+        Args:
+            other (Store): The store to combine with.
+
+        Raises:
+            TypeError: If other is not a Store.
+
+        Returns:
+            Store: A new store containing the products of both stores.
+        """
         # store validation
         if not isinstance(other, Store):
             raise TypeError("Can only add another Store.")
 
-        new_store = Store(self.products.copy())
+        new_store = Store(self._products)
 
-        for product in other.products:
+        for product in other._products:
             new_store.add_product(product)
 
         return new_store
@@ -61,12 +119,16 @@ class Store:
         if not isinstance(product, products.Product):
             raise TypeError("product must be instance of the Product class.")
 
-        if product in self.products:
-            product_index = self.products.index(product)
-            self.products[product_index].quantity += product.quantity
+        by_name = self._name_index()
+        existing_product = by_name.get(product.name)
+        if existing_product is not None:
+            # The sum of two validated quantities needs no further validation
+            existing_product._set_quantity_unchecked(existing_product._quantity + product._quantity)
             return f"Product '{product.name}' is already in the store. Quantity was updated."
 
-        self.products.append(product)
+        self._products.append(product)
+        by_name[product.name] = product
+        self._stock_seen = -1
         return f"Product '{product.name}' added successfully."
 
     def remove_product(self, product):
@@ -86,77 +148,188 @@ class Store:
         # Product validation
         if not isinstance(product, products.Product):
             raise TypeError("product must be instance of the Product class.")
-        if not product in self.products:
+        by_name = self._name_index()
+        removed_product = by_name.pop(product.name, None)
+        if removed_product is None:
             raise ValueError("Product doesn't exist.")
 
-        self.products.remove(product)
+        # Delete by identity, so no __eq__ calls are needed to find the position
+        position = next(index for index, listed in enumerate(self._products)
+                        if listed is removed_product)
+        del self._products[position]
+
+        # A product with the same name further down the list takes over the name index
+        for following_product in itertools.islice(self._products, position, None):
+            by_name.setdefault(following_product.name, following_product)
+        self._stock_seen = -1
         return f"Product '{product.name}' removed successfully."
 
     def get_total_quantity(self) -> int:
         """
-        Calculates the total quantity of all products in the store.
+        Returns the total quantity of all products in the store.
+
+        The total is cached and only recalculated after a product's stock changed.
 
         Returns:
             int: The total quantity of all products.
         """
-        return sum(product.quantity for product in self.products)
+        self._refresh_stock_views()
+        return self._total_quantity
 
-    def get_all_products(self) -> list[products.Product]:
+    def get_all_products(self) -> tuple[products.Product, ...]:
         """
         Retrieves all active products from the store.
 
+        The result is cached and only rebuilt after a product's stock changed.
+
+        Returns:
+            tuple[products.Product, ...]: The active Product instances.
+        """
+        self._refresh_stock_views()
+        return self._active_products
+
+    @staticmethod
+    def _unpack_order_item(item):
+        """
+        Unpacks a shopping list item into its product and quantity.
+
+        Args:
+            item (tuple): A tuple (Product, int).
+
+        Raises:
+            TypeError: If item is not a tuple with exactly two elements.
+
         Returns:
-            list[products.Product]: A list of active Product instances.
+            tuple: The product and the quantity.
         """
-        active_products = []
-        for product in self.products:
-            if product.is_active():
-                active_products.append(product)
-        return active_products
+        # Ensure each item is a tuple with exactly two elements
+        if not isinstance(item, tuple) or len(item) != 2:
+            raise TypeError("Each item in shopping_list must be a tuple (Product, int).")
+        return item
+
+    def _check_order_line(self, product, quantity):
+        """
+        Validates a single line of an order.
+
+        Args:
+            product (products.Product): The product to order.
+            quantity (int): The quantity to order.
+
+        Raises:
+            TypeError: If product is not a Product instance or quantity is not an integer.
+            ValueError: If the product is not available in the store or if quantity is negative.
+        """
+        # Ensure the first element is a Product instance
+        if not isinstance(product, products.Product):
+            raise TypeError("First item in tuple must be a Product instance.")
+
+        # Ensure the product exists in the store
+        if product.name not in self._name_index():
+            raise ValueError(f"Product {product.name} is not available in the store.")
+
+        # Ensure the second element is an integer representing quantity
+        if type(quantity) is not int:
+            raise TypeError("Quantity must be an integer.")
+        if quantity < 0:
+            raise ValueError("Quantity cannot be negative.")
+
+    @staticmethod
+    def _check_combined_stock(shopping_list):
+        """
+        Validates that products ordered on several lines have enough stock for all of them.
+
+        Args:
+            shopping_list (list[tuple]): The validated lines of the order.
+
+        Raises:
+            ValueError: If the lines of a product together exceed its stock.
+        """
+        requested = {}
+        for product, quantity in shopping_list:
+            if product.is_stock_tracked():
+                _, requested_quantity = requested.get(id(product), (product, 0))
+                requested[id(product)] = (product, requested_quantity + quantity)
+
+        for product, quantity in requested.values():
+            if quantity > product.quantity:
+                raise ValueError("Not enough products in stock.")
+
+    def order_one(self, product, quantity) -> float:
+        """
+        Processes an order of a single product.
+
+        Args:
+            product (products.Product): The product to order.
+            quantity (int): The quantity to order.
+
+        Raises:
+            TypeError: If product is not a Product instance or quantity is not an integer.
+            ValueError: If the product is not available in the store, if quantity is negative,
+                        or if quantity exceeds the product's stock or purchase limit.
+
+        Returns:
+            float: The total price of the order.
+        """
+        self._check_order_line(product, quantity)
+        return product.buy(quantity)
 
     def order(self, shopping_list: list[tuple]):
         """
         Processes an order based on the given shopping list.
 
+        The whole order is validated first, so a failing order leaves the stock unchanged.
+
         Args:
             shopping_list (list[tuple]): A list of tuples where each tuple contains a Product instance
                                          and an integer representing the quantity.
 
         Raises:
             TypeError: If shopping_list is not a list or if any item is not a tuple of (Product, int).
-            ValueError: If a product is not available in the store or if quantity is negative.
+            ValueError: If a product is not available in the store, if quantity is negative,
+                        or if the order exceeds a product's stock or purchase limit.
 
         Returns:
-            float: The total price of the order.
+            float: The total price of the order, rounded to two decimal places.
         """
         # Ensure shopping_list is a list
         if not isinstance(shopping_list, list):
             raise TypeError("shopping_list must be a list of tuples (Product, int).")
 
-        total_order_price = 0
+        # Empty and single-line orders need no combined validation pass
+        if not shopping_list:
+            return 0.0
+        if len(shopping_list) == 1:
+            return self.order_one(*self._unpack_order_item(shopping_list[0]))
 
+        # Validate the whole order in one pass before any stock is changed;
+        # each line is a purchase of its own, checked against the purchase limits
         for item in shopping_list:
-            # Ensure each item is a tuple with exactly two elements
-            if not isinstance(item, tuple) or len(item) != 2:
-                raise TypeError("Each item in shopping_list must be a tuple (Product, int).")
+            product, quantity = self._unpack_order_item(item)
+            self._check_order_line(product, quantity)
+            product._check_purchase(quantity)
 
-            product, quantity = item  # Unpack the tuple
+        # Lines for the same product are checked against its stock together
+        if len({id(product) for product, _ in shopping_list}) < len(shopping_list):
+            self._check_combined_stock(shopping_list)
 
-            # Ensure the product exists in the store
-            if product not in self.products:
-                raise ValueError(f"Product {product.name} is not available in the store.")
+        # Every line is valid, so commit the purchases without checking them again
+        total_order_price = 0.0
+        for product, quantity in shopping_list:
+            total_order_price += product._commit_purchase(quantity)
 
-            # Ensure the first element is a Product instance
-            if not isinstance(product, products.Product):
-                raise TypeError("First item in tuple must be a Product instance.")
+        # Summing the rounded line totals can still add float noise like 0.30000000000000004
+        return round(total_order_price, 2)
 
-            # Ensure the second element is an integer representing quantity
-            if not isinstance(quantity, int):
-                raise TypeError("Quantity must be an integer.")
-            if quantity < 0:
-                raise ValueError("Quantity cannot be negative.")
+    @property
+    def products(self) -> tuple[products.Product, ...]:
+        """
+        Get the products of the store, including inactive ones.
 
-            # Process the purchase and update total price
-            total_order_price += product.buy(quantity)
+        Use add_product() and remove_product() to change them. Defined last,
+        since the name would otherwise shadow the products module in the
+        annotations of the class body.
 
-        return total_order_price
+        Returns:
+            tuple[products.Product, ...]: The Product instances in the order they were added.
+        """
+        return tuple(self._products)
@@ -1,6 +1,7 @@
 import pytest
 
-from products import Product
+import promotions
+from products import Product, NonStockedProduct, LimitedProduct, MAX_ORDER_AMOUNT
 
 
 def test_create_valid_product():
@@ -30,6 +31,9 @@ def test_create_invalid_product():
     with pytest.raises(ValueError, match="Quantity cannot be negative"):
         Product("Test product", 99, -5)
 
+    with pytest.raises(ValueError, match="Price must be a finite number"):
+        Product("Test product", float("inf"), 5)
+
 
 def test_product_becomes_inactive():
     product = Product("Test product", 99, 5)
@@ -62,3 +66,132 @@ def test_buy_product_too_large_quantity():
     product = Product("Test product", 100, 5)
     with pytest.raises(ValueError, match="Not enough products in stock"):
         product.buy(10)
+
+
+def test_max_orderable():
+    product = Product("Test product", 100, 5)
+    assert product.max_orderable() == 5
+    assert product.max_orderable(3) == 2
+
+    license_product = NonStockedProduct("Test license", 100)
+    assert license_product.max_orderable(3) == MAX_ORDER_AMOUNT
+
+    shipping = LimitedProduct("Test shipping", 10, 5, maximum=2)
+    assert shipping.max_orderable() == 2
+    assert shipping.max_orderable(2) == 0
+
+
+def test_equal_products_share_hash():
+    product = Product("Test product", 100, 5)
+    same_name = Product("Test product", 50, 1)
+    assert product == same_name
+    assert {product: 1}[same_name] == 1
+
+
+def test_str_reflects_product_changes():
+    product = Product("Test product", 100, 5)
+    assert str(product) == "Test product | Price: 100.0€ | Quantity: 5"
+
+    product.buy(2)
+    product.price = 80
+    assert str(product) == "Test product | Price: 80.0€ | Quantity: 3"
+
+
+def test_products_use_slots():
+    for product in (Product("Test product", 100, 5),
+                    NonStockedProduct("Test license", 100),
+                    LimitedProduct("Test shipping", 10, 5, maximum=1)):
+        assert not hasattr(product, "__dict__")
+        with pytest.raises(AttributeError):
+            product.colour = "red"
+
+
+def test_buy_product_with_promotions():
+    product = Product("Test product", 100, 20)
+
+    product.promotion = promotions.SecondHalfPrice("Second Half price!")
+    assert product.buy(3) == 250.00
+
+    product.promotion = promotions.ThirdOneFree("Third One Free!")
+    assert product.buy(7) == 500.00
+
+    product.promotion = promotions.PercentDiscount("30% off!", percent=30)
+    assert product.buy(2) == 140.00
+
+    product.promotion = None
+    product.price = 0.1
+    assert product.buy(3) == 0.30
+
+    product.price = 19.99
+    assert product.buy(3) == 59.97
+
+
+def test_price_is_rounded_to_cents():
+    assert Product("Test product", 0.1 * 3, 1).price == 0.3
+    assert Product("Test product", 33.3 * 3, 1).price == 99.9
+
+    product = Product("Test product", 1.005, 100)
+    trusted = Product._from_trusted("Test product", 1.005, 100)
+    assert str(product) == str(trusted) == "Test product | Price: 1.0€ | Quantity: 100"
+    assert product.buy(10) == trusted.buy(10) == 10.0
+
+    product.promotion = promotions.ThirdOneFree("Third One Free!")
+    assert product.buy(3) == 2.0
+
+
+def test_str_is_cached_until_product_changes():
+    product = LimitedProduct("Test shipping", 10, 5, maximum=1)
+    first = str(product)
+    assert str(product) is first
+
+    product.promotion = promotions.PercentDiscount("30% off!", percent=30)
+    assert str(product) == "Test shipping | Price: 10.0€ | Quantity: 5 | Maximum: 1 | Promotion: 30% off!"
+
+
+def test_limited_product_maximum_setter():
+    product = LimitedProduct("Test shipping", 10, 5, maximum=1)
+    assert str(product) == "Test shipping | Price: 10.0€ | Quantity: 5 | Maximum: 1"
+
+    product.maximum = 3
+    assert str(product) == "Test shipping | Price: 10.0€ | Quantity: 5 | Maximum: 3"
+    assert product.buy(3) == 30
+
+    with pytest.raises(ValueError, match="Maximum must be positive"):
+        product.maximum = -2
+    assert product.maximum == 3
+
+
+def test_buy_requires_exact_int_quantity():
+    product = Product("Test product", 100, 5)
+    for quantity in (2.0, "2", True):
+        with pytest.raises(TypeError, match="Quantity must be an integer"):
+            product.buy(quantity)
+    assert product.quantity == 5
+
+
+def test_non_stocked_buy_batch():
+    license_product = NonStockedProduct("Test license", 125)
+    license_product.promotion = promotions.PercentDiscount("30% off!", percent=30)
+    assert license_product.buy_batch([1, 2, 3]) == [license_product.buy(q) for q in (1, 2, 3)]
+
+    with pytest.raises(ValueError, match="Quantity cannot be negative or 0."):
+        license_product.buy_batch([1, 0])
+
+
+def test_equality_for_constructed_names():
+    prefix = "Test "
+    product = Product(prefix + "product", 100, 5)
+    assert product == Product("".join(["Test", " ", "product"]), 50, 1)
+    assert product != Product("Test product 2", 100, 5)
+
+
+def test_from_trusted_matches_constructor():
+    for trusted, validated in ((Product._from_trusted("Test product", 99, 5), Product("Test product", 99, 5)),
+                               (NonStockedProduct._from_trusted("Test license", 125),
+                                NonStockedProduct("Test license", 125)),
+                               (LimitedProduct._from_trusted("Test shipping", 10, 250, maximum=1),
+                                LimitedProduct("Test shipping", 10, 250, maximum=1))):
+        assert type(trusted) is type(validated)
+        assert str(trusted) == str(validated)
+        assert trusted.is_active() is validated.is_active()
+        assert trusted.buy(1) == validated.buy(1)
@@ -0,0 +1,70 @@
+import pytest
+
+import promotions
+from products import Product
+
+
+def test_apply_batch_matches_apply_promotion():
+    prices = [100.0, 0.1, 19.99]
+    quantities = [0, 1, 7]
+    for promotion in (promotions.PercentDiscount("30% off!", percent=30),
+                      promotions.SecondHalfPrice("Second Half price!"),
+                      promotions.ThirdOneFree("Third One Free!")):
+        expected = [promotion.apply_promotion(Product("Test product", price, 10), quantity)
+                    for price, quantity in zip(prices, quantities)]
+        assert promotion.apply_batch(prices, quantities) == expected
+
+
+def test_promotions_use_slots():
+    for promotion in (promotions.PercentDiscount("30% off!", percent=30),
+                      promotions.SecondHalfPrice("Second Half price!"),
+                      promotions.ThirdOneFree("Third One Free!")):
+        assert not hasattr(promotion, "__dict__")
+
+
+def test_renaming_a_promotion_updates_product_strings():
+    product = Product("Test product", 100, 10)
+    product.promotion = promotions.PercentDiscount("30% off!", percent=30)
+    assert str(product) == "Test product | Price: 100.0€ | Quantity: 10 | Promotion: 30% off!"
+
+    product.promotion.name = "Spring sale!"
+    assert str(product) == "Test product | Price: 100.0€ | Quantity: 10 | Promotion: Spring sale!"
+    with pytest.raises(ValueError, match="Promotion name cannot be empty"):
+        product.promotion.name = " "
+
+
+def test_changing_percent_updates_product_prices():
+    product = Product("Test product", 100, 10)
+    product.promotion = promotions.PercentDiscount("30% off!", percent=30)
+    assert product.buy(1) == 70
+
+    product.promotion.percent = 50
+    assert product.buy(1) == 50
+    with pytest.raises(ValueError, match="Percent must be greater than 0"):
+        product.promotion.percent = 100
+    assert product.promotion.percent == 50
+
+
+def test_apply_promotion_requires_exact_int_quantity():
+    product = Product("Test product", 100, 10)
+    for promotion in (promotions.PercentDiscount("30% off!", percent=30),
+                      promotions.SecondHalfPrice("Second Half price!"),
+                      promotions.ThirdOneFree("Third One Free!")):
+        for quantity in (True, 2.0):
+            with pytest.raises(TypeError, match="Quantity must be an integer"):
+                promotion.apply_promotion(product, quantity)
+
+
+class BulkDiscount(promotions.Promotion):
+    def apply_promotion(self, product, quantity) -> float:
+        return product.price * quantity - (10 if quantity >= 5 else 0)
+
+
+def test_promotion_without_build_uses_apply_promotion():
+    product = Product("Test product", 100, 10)
+    product.promotion = BulkDiscount("10 off from 5 pcs!")
+    assert product.buy(5) == 490
+    assert product.buy(2) == 200
+
+    with pytest.raises(NotImplementedError):
+        product.promotion.apply_batch([100], [5])
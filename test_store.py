@@ -0,0 +1,207 @@
+import pytest
+
+from products import Product, LimitedProduct
+from store import Store
+
+
+def test_get_all_products_reflects_inventory_changes():
+    mac = Product("MacBook Air M2", 1450, 100)
+    pixel = Product("Google Pixel 7", 500, 2)
+    best_buy = Store([mac, pixel])
+    assert best_buy.get_all_products() == (mac, pixel)
+
+    best_buy.order([(pixel, 2)])
+    assert best_buy.get_all_products() == (mac,)
+
+    mac.deactivate()
+    assert best_buy.get_all_products() == ()
+
+    earbuds = Product("Bose QuietComfort Earbuds", 250, 500)
+    best_buy.add_product(earbuds)
+    assert best_buy.get_all_products() == (earbuds,)
+
+
+def test_get_total_quantity_follows_product_changes():
+    mac = Product("MacBook Air M2", 1450, 100)
+    pixel = Product("Google Pixel 7", 500, 250)
+    best_buy = Store([mac, pixel])
+    assert best_buy.get_total_quantity() == 350
+
+    best_buy.order([(mac, 10)])
+    pixel.quantity = 50
+    assert best_buy.get_total_quantity() == 140
+
+    best_buy.add_product(Product("Google Pixel 7", 500, 5))
+    assert best_buy.get_total_quantity() == 145
+
+    best_buy.remove_product(mac)
+    pixel.buy(5)
+    assert best_buy.get_total_quantity() == 50
+
+
+def test_failed_order_leaves_stock_unchanged():
+    mac = Product("MacBook Air M2", 1450, 100)
+    pixel = Product("Google Pixel 7", 500, 3)
+    best_buy = Store([mac, pixel])
+
+    with pytest.raises(ValueError, match="Not enough products in stock"):
+        best_buy.order([(mac, 1), (pixel, 2), (pixel, 2)])
+
+    assert mac.quantity == 100
+    assert pixel.quantity == 3
+    assert best_buy.order([(mac, 1), (pixel, 2), (pixel, 1)]) == 2950
+    assert best_buy.get_all_products() == (mac,)
+
+
+def test_order_checks_every_line_as_a_purchase():
+    pixel = Product("Google Pixel 7", 500, 3)
+    shipping = LimitedProduct("Shipping", 10, 250, maximum=1)
+    best_buy = Store([pixel, shipping])
+
+    with pytest.raises(ValueError, match="Quantity cannot be negative or 0."):
+        best_buy.order([(pixel, 0), (pixel, 1)])
+    with pytest.raises(ValueError, match="You cannot buy more than '1' pcs"):
+        best_buy.order([(pixel, 1), (shipping, 2)])
+    assert pixel.quantity == 3
+    assert shipping.quantity == 250
+
+    # The maximum applies per purchase, so every line may use it
+    assert best_buy.order([(shipping, 1), (shipping, 1)]) == 20
+    assert shipping.quantity == 248
+
+
+class GiftWrappedProduct(Product):
+    def _commit_purchase(self, quantity):
+        return super()._commit_purchase(quantity) + 2
+
+
+def test_single_and_multi_line_orders_commit_purchases_alike():
+    gift = GiftWrappedProduct("Gift card", 50, 10)
+    mac = Product("MacBook Air M2", 1450, 100)
+    best_buy = Store([gift, mac])
+    assert best_buy.order([(gift, 1)]) == 52
+    assert best_buy.order([(gift, 1), (mac, 1)]) == 1502
+    assert gift.quantity == 8
+
+
+def test_order_one_and_empty_order():
+    pixel = Product("Google Pixel 7", 500, 3)
+    best_buy = Store([pixel])
+    assert best_buy.order([]) == 0
+    assert best_buy.order_one(pixel, 2) == 1000
+    assert best_buy.order([(pixel, 1)]) == 500
+    assert pixel.quantity == 0
+
+    with pytest.raises(ValueError, match="is not available in the store"):
+        best_buy.order_one(Product("MacBook Air M2", 1450, 100), 1)
+
+
+def test_membership_uses_product_names():
+    pixel = Product("Google Pixel 7", 500, 3)
+    best_buy = Store([pixel])
+    assert Product("Google Pixel 7", 1, 1) in best_buy
+    assert "Google Pixel 7" not in best_buy
+
+    pixel.name = "Google Pixel 8"
+    assert pixel in best_buy
+    assert Product("Google Pixel 7", 1, 1) not in best_buy
+
+    best_buy.remove_product(Product("Google Pixel 8", 1, 1))
+    assert pixel not in best_buy
+    assert best_buy.products == ()
+
+
+def test_renames_keep_products_sharing_a_name_indexed():
+    first = Product("Google Pixel 7", 500, 3)
+    second = Product("Google Pixel 7", 450, 3)
+    best_buy = Store([first, second])
+
+    first.name = "Google Pixel 8"
+    assert Product("Google Pixel 7", 1, 1) in best_buy
+    assert best_buy.order([(second, 1), (first, 1)]) == 950
+
+    # Renaming onto a taken name keeps the first listed product indexed
+    second.name = "Google Pixel 8"
+    best_buy.remove_product(Product("Google Pixel 8", 1, 1))
+    assert best_buy.products == (second,)
+    assert Product("Google Pixel 8", 1, 1) in best_buy
+
+
+def test_total_quantity_of_combined_stores_stays_in_sync():
+    mac = Product("MacBook Air M2", 1450, 100)
+    pixel = Product("Google Pixel 7", 500, 250)
+    combined = Store([mac]) + Store([pixel])
+    assert combined.get_total_quantity() == 350
+
+    pixel.buy(50)
+    combined.order([(mac, 10), (pixel, 10)])
+    assert combined.get_total_quantity() == 280
+
+
+def test_add_stores_merges_products_by_name():
+    mac = Product("MacBook Air M2", 1450, 100)
+    pixel = Product("Google Pixel 7", 500, 250)
+    combined = Store([mac, pixel]) + Store([Product("Google Pixel 7", 500, 5), Product("Shipping", 10, 1)])
+
+    assert [product.name for product in combined.products] == ["MacBook Air M2", "Google Pixel 7", "Shipping"]
+    assert pixel.quantity == 255
+    assert combined.get_total_quantity() == 356
+
+
+def test_store_copies_the_product_list():
+    mac = Product("MacBook Air M2", 1450, 100)
+    pixel = Product("Google Pixel 7", 500, 3)
+    products_list = [mac, pixel]
+    best_buy = Store(products_list)
+
+    products_list.remove(mac)
+    assert best_buy.products == (mac, pixel)
+    with pytest.raises(AttributeError):
+        best_buy.products = [pixel]
+
+    best_buy.remove_product(pixel)
+    assert best_buy.get_all_products() == (mac,)
+
+
+def test_same_product_listed_twice():
+    pixel = Product("Google Pixel 7", 500, 5)
+    best_buy = Store([pixel, pixel])
+    pixel.buy(1)
+    assert best_buy.get_total_quantity() == 8
+
+    best_buy.remove_product(pixel)
+    assert best_buy.products == (pixel,)
+    pixel.buy(1)
+    assert best_buy.get_total_quantity() == 3
+
+
+def test_quantities_are_not_limited_in_size():
+    pixel = Product("Google Pixel 7", 500, 10 ** 19)
+    best_buy = Store([pixel])
+    pixel.quantity = 2 ** 63
+    assert best_buy.get_total_quantity() == 2 ** 63
+
+
+def test_remove_product_keeps_columns_in_sync():
+    mac = Product("MacBook Air M2", 1450, 100)
+    pixel = Product("Google Pixel 7", 500, 250)
+    earbuds = Product("Bose QuietComfort Earbuds", 250, 500)
+    best_buy = Store([mac, pixel, earbuds])
+
+    best_buy.remove_product(pixel)
+    assert best_buy.products == (mac, earbuds)
+    assert best_buy.get_total_quantity() == 600
+
+    earbuds.quantity = 0
+    assert best_buy.get_all_products() == (mac,)
+    assert best_buy.get_total_quantity() == 100
+
+    pixel.quantity = 1
+    assert best_buy.get_total_quantity() == 100
+
+
+def test_order_total_is_rounded_once_more_after_summing():
+    gum = Product("Gum", 0.1, 10)
+    mints = Product("Mints", 0.2, 10)
+    best_buy = Store([gum, mints])
+    assert best_buy.order([(gum, 1), (mints, 1)]) == 0.3